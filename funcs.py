@@ -1,7 +1,44 @@
 import re
 import os
+import tempfile
+import mmap
+import threading
+import zipfile
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain, islice
+from typing import Iterable, Iterator
+
 import openai
 
+try:
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+except ImportError:
+    np = None
+
+try:
+    from numba import njit, types
+    from numba.typed import Dict
+except ImportError:
+    njit = None
+
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+# Skips Unicode category lookups for words; any other non-whitespace character, including
+# non-ASCII letters, becomes a single-character token. Unicode whitespace is still skipped.
+_ASCII_WORD = "[A-Za-z0-9_]"
+_ASCII_TOKEN_RE = re.compile(rf"{_ASCII_WORD}+|[^A-Za-z0-9_\s]")
+
+_DEFAULT_DELIM = frozenset([".", "?", "!", ";"])
+
+# Bump when tokenization changes so corpora cached by `tokenize_to_corpus` are rebuilt.
+_TOKENIZER_VERSION = 2
+
+# Upper bound on OpenAI requests in flight at once.
+_MAX_CONCURRENT_REQUESTS = 32
+
 
 def get_api_key() -> str:
     """
@@ -16,8 +53,181 @@ def get_api_key() -> str:
     return api_key
 
 
+@lru_cache(maxsize=None)
+def _delim_split_re(delim: frozenset[str], ascii_only: bool = False) -> re.Pattern:
+    """
+    Compile a pattern that splits lowercased text on the given sentence delimiters.
+
+    A delimiter only ever matches a whole token, so word delimiters are anchored so they
+    do not match inside longer words, and delimiters that cannot be a single token never
+    match at all.
+
+    Args:
+        delim (frozenset[str]): Sentence delimiters.
+        ascii_only (bool): Match the ASCII-only token pattern.
+
+    Returns:
+        re.Pattern: A pattern with one capturing group around the delimiter.
+    """
+
+    token_re = _ASCII_TOKEN_RE if ascii_only else _TOKEN_RE
+    word = _ASCII_WORD if ascii_only else r"\w"
+
+    alternatives = []
+    for d in sorted(delim):
+        if not token_re.fullmatch(d):
+            continue
+        if re.fullmatch(rf"{word}+", d):
+            alternatives.append(rf"(?<!{word}){re.escape(d)}(?!{word})")
+        else:
+            alternatives.append(re.escape(d))
+
+    if not alternatives:
+        return re.compile(r"(?!)")
+    return re.compile("(" + "|".join(alternatives) + ")")
+
+
+def _split_lines(
+    lines, delim: frozenset[str], ascii_only: bool = False
+) -> Iterator[list[str]]:
+    """
+    Lowercase and tokenize an iterable of lines, splitting into sentences on `delim`.
+
+    Args:
+        lines (Iterable[str]): Lines of text, e.g. an open text file.
+        delim (frozenset[str]): Sentence delimiters.
+        ascii_only (bool): Use the ASCII-only token pattern.
+
+    Yields:
+        list[str]: The sentences of all lines, in order. The last sentence holds the
+            tokens after the final delimiter and may be empty.
+    """
+
+    findall = (_ASCII_TOKEN_RE if ascii_only else _TOKEN_RE).findall
+    split = _delim_split_re(delim, ascii_only).split
+
+    current = []
+    for line in lines:
+        # Parts alternate text, delimiter, text, ...; the loop runs once per sentence.
+        parts = split(line.lower())
+        current.extend(findall(parts[0]))
+        for i in range(1, len(parts), 2):
+            current.append(parts[i])
+            yield current
+            current = findall(parts[i + 1])
+    yield current
+
+
+def _read_lines(file, size: int) -> Iterator[str]:
+    """
+    Lazily decode the next `size` bytes of a binary file line by line.
+
+    Args:
+        file (BinaryIO): A file opened in binary mode, positioned at a line start.
+        size (int): Number of bytes to read; should end just after a newline or at end of file.
+
+    Yields:
+        str: Each line, decoded as UTF-8.
+    """
+
+    while size > 0:
+        line = file.readline(size)
+        if not line:
+            break
+        size -= len(line)
+        yield line.decode("utf-8")
+
+
+def _split_chunk(
+    file_path: str,
+    start: int,
+    end: int,
+    delim: frozenset[str],
+    ascii_only: bool = False,
+) -> list[list[str]]:
+    """
+    Split the bytes [start, end) of a UTF-8 file into sentences. Runs in a worker process.
+
+    Args:
+        file_path (str): Path to the input text file.
+        start (int): Byte offset of the chunk start; must follow a newline or be 0.
+        end (int): Byte offset of the chunk end; must follow a newline or be the file size.
+        delim (frozenset[str]): Sentence delimiters.
+        ascii_only (bool): Use the ASCII-only token pattern.
+
+    Returns:
+        list[list[str]]: The sentences of the chunk, as yielded by `_split_lines`.
+    """
+
+    with open(file_path, "rb") as file:
+        file.seek(start)
+        return list(_split_lines(_read_lines(file, end - start), delim, ascii_only))
+
+
+def _chunk_bounds(file_path: str, n_chunks: int) -> list[tuple[int, int]]:
+    """
+    Split a file into at most `n_chunks` byte ranges that each end just after a newline.
+
+    Tokens never span a newline, so chunks cut there can be tokenized independently
+    and concatenated without any overlap handling.
+
+    Args:
+        file_path (str): Path to the input text file.
+        n_chunks (int): Desired number of chunks.
+
+    Returns:
+        list[tuple[int, int]]: (start, end) byte offsets covering the whole file.
+    """
+
+    size = os.path.getsize(file_path)
+    if size == 0:
+        return [(0, 0)]
+
+    bounds = [0]
+    with open(file_path, "rb") as file, mmap.mmap(
+        file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mm:
+        for i in range(1, n_chunks):
+            pos = mm.find(b"\n", max(size * i // n_chunks, bounds[-1]))
+            if pos == -1:
+                break
+            if pos + 1 > bounds[-1]:
+                bounds.append(pos + 1)
+    if bounds[-1] < size:
+        bounds.append(size)
+
+    return list(zip(bounds, bounds[1:]))
+
+
+def iter_sentences(
+    file_path: str, delim: list[str] | None = None, ascii_only: bool = False
+) -> Iterator[list[str]]:
+    """
+    Lazily read a text file sentence by sentence, tokenized as in `txt_to_string_list`.
+    Only the current line and sentence are held in memory.
+
+    Args:
+        file_path (str): Path to the input text file.
+        delim (list[str] | None): List of delimiters to split sentences.
+            Default is None, which uses ['.', '?', '!', ';'].
+        ascii_only (bool): Treat only ASCII letters, digits and underscores as word characters.
+
+    Yields:
+        list[str]: Each sentence in order. The last one holds the tokens after the final
+            delimiter and may be empty.
+    """
+
+    delim = _DEFAULT_DELIM if delim is None else frozenset(delim)
+
+    with open(file_path, "r", encoding="utf-8") as file:
+        yield from _split_lines(file, delim, ascii_only)
+
+
 def txt_to_string_list(
-    file_path: str, delim: list[str] = [".", "?", "!", ";"]
+    file_path: str,
+    delim: list[str] | None = None,
+    workers: int | None = None,
+    ascii_only: bool = False,
 ) -> list[list[str]]:
     """
     Read a text file and split its content into a list of lists of strings by sentence delimiters.
@@ -25,112 +235,564 @@ def txt_to_string_list(
 
     Args:
         file_path (str): Path to the input text file.
-        delim (list[str]): List of delimiters to split sentences.
-            Default is ['.', '?', '!'].
+        delim (list[str] | None): List of delimiters to split sentences.
+            Default is None, which uses ['.', '?', '!', ';'].
+        workers (int | None): Number of processes to tokenize the file with. The file is
+            split into newline-aligned chunks, one per worker. Default is None, which
+            tokenizes in the current process.
+        ascii_only (bool): Treat only ASCII letters, digits and underscores as word
+            characters. Faster on ASCII text; any other non-whitespace character becomes its
+            own token.
+            Default is False.
 
     Returns:
         list[list[str]]: A list of lists, where each inner list contains strings split by the specified delimiters.
     """
 
-    with open(file_path, "r", encoding="utf-8") as file:
-        text = file.read().lower()
+    if workers is not None and workers > 1:
+        delim = _DEFAULT_DELIM if delim is None else frozenset(delim)
+        starts, ends = zip(*_chunk_bounds(file_path, workers))
+        sentences = [[]]
+        with ProcessPoolExecutor(max_workers=len(starts)) as executor:
+            for chunk in executor.map(
+                _split_chunk,
+                [file_path] * len(starts),
+                starts,
+                ends,
+                [delim] * len(starts),
+                [ascii_only] * len(starts),
+            ):
+                # A sentence left open at the end of one chunk continues in the next.
+                sentences[-1].extend(chunk[0])
+                sentences.extend(chunk[1:])
+        return sentences
+
+    return list(iter_sentences(file_path, delim, ascii_only))
+
+
+def _require_numpy() -> None:
+    """
+    Raise an ImportError if numpy, which TokenizedCorpus needs, is not installed.
+    """
 
-    tokens = re.findall(r"\w+|[^\w\s]", text)
+    if np is None:
+        raise ImportError("numpy is required to build a TokenizedCorpus.")
 
-    sentences = [[]]
-    for token in tokens:
-        if token in delim:
-            sentences[-1].append(token)
-            sentences.append([])
-        else:
-            sentences[-1].append(token)
 
-    return sentences
+# eq=False: the generated __eq__ would compare ndarray fields, which raises ValueError.
+@dataclass(eq=False)
+class TokenizedCorpus:
+    """
+    Sentences stored as integer token IDs in one flat array rather than as lists of strings.
+
+    Attributes:
+        vocab (list[str]): Token strings, indexed by token ID.
+        token_ids (np.ndarray): int32 token IDs of all sentences, concatenated.
+        sentence_offsets (np.ndarray): int64 offsets with one entry per sentence plus one;
+            sentence i is token_ids[sentence_offsets[i] : sentence_offsets[i + 1]].
+        token_index (dict[str, int] | None): Token ID of each string in `vocab`. Built from `vocab`
+            when not given.
+    """
+
+    vocab: list[str]
+    token_ids: "np.ndarray"
+    sentence_offsets: "np.ndarray"
+    token_index: dict[str, int] | None = field(default=None, repr=False)
+
+    def __post_init__(self):
+        if self.token_index is None:
+            self.token_index = {token: i for i, token in enumerate(self.vocab)}
+
+    @classmethod
+    def from_sentences(cls, sentences: list[list[str]]) -> "TokenizedCorpus":
+        """
+        Intern the tokens of a list of sentences into a TokenizedCorpus.
+
+        Args:
+            sentences (list[list[str]]): A list of lists, where each inner list contains strings.
+
+        Returns:
+            TokenizedCorpus: The same sentences as token IDs.
+        """
+
+        _require_numpy()
+
+        vocab = {}
+        token_ids = np.fromiter(
+            (vocab.setdefault(token, len(vocab)) for sentence in sentences for token in sentence),
+            dtype=np.int32,
+        )
+        sentence_offsets = np.zeros(len(sentences) + 1, dtype=np.int64)
+        np.cumsum(
+            np.fromiter(map(len, sentences), dtype=np.int64, count=len(sentences)),
+            out=sentence_offsets[1:],
+        )
+        return cls(list(vocab), token_ids, sentence_offsets, vocab)
+
+    def to_sentences(self) -> list[list[str]]:
+        """
+        Convert the corpus back into a list of lists of strings.
+
+        Returns:
+            list[list[str]]: A list of lists, where each inner list contains strings.
+        """
+
+        words = [self.vocab[i] for i in self.token_ids.tolist()]
+        offsets = self.sentence_offsets.tolist()
+        return [words[start:end] for start, end in zip(offsets, offsets[1:])]
+
+
+def _corpus_cache_key(file_path: str, delim: frozenset[str], ascii_only: bool) -> "np.ndarray":
+    """
+    Build the key a cached corpus must match: tokenizer version, source file state and options.
+
+    Args:
+        file_path (str): Path to the input text file.
+        delim (frozenset[str]): Sentence delimiters.
+        ascii_only (bool): Whether the ASCII-only token pattern is used.
+
+    Returns:
+        np.ndarray: The key as a uint8 array.
+    """
+
+    stat = os.stat(file_path)
+    key = "\n".join(
+        [
+            str(_TOKENIZER_VERSION),
+            str(stat.st_mtime_ns),
+            str(stat.st_size),
+            str(ascii_only),
+            *sorted(delim),
+        ]
+    )
+    return np.frombuffer(key.encode("utf-8"), dtype=np.uint8)
+
+
+def _load_cached_corpus(cache_path: str, key: "np.ndarray") -> TokenizedCorpus | None:
+    """
+    Load a corpus saved by `tokenize_to_corpus`.
+
+    Args:
+        cache_path (str): Path to the cached `.tok.npz` file.
+        key (np.ndarray): Key from `_corpus_cache_key` that the cache must match.
+
+    Returns:
+        TokenizedCorpus | None: The corpus, or None if there is no readable cache matching `key`.
+    """
+
+    try:
+        with np.load(cache_path, allow_pickle=False) as data:
+            if not np.array_equal(data["key"], key):
+                return None
+            vocab = data["vocab"].tobytes().decode("utf-8")
+            return TokenizedCorpus(
+                vocab.split("\n") if vocab else [],
+                data["token_ids"],
+                data["sentence_offsets"],
+            )
+    except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+        return None
+
+
+def _save_cached_corpus(cache_path: str, key: "np.ndarray", corpus: TokenizedCorpus) -> None:
+    """
+    Save a corpus for `_load_cached_corpus`. Best effort: write errors are ignored.
+
+    The file is written under a temporary name in the same directory and then renamed into
+    place, so readers never see a partially written cache.
+
+    Args:
+        cache_path (str): Path to the cached `.tok.npz` file.
+        key (np.ndarray): Key from `_corpus_cache_key` to store with the corpus.
+        corpus (TokenizedCorpus): The corpus to save.
+    """
+
+    tmp_path = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            dir=os.path.dirname(cache_path) or ".", suffix=".tmp", delete=False
+        ) as file:
+            tmp_path = file.name
+            # Tokens never contain whitespace, so newline-joined UTF-8 bytes round-trip exactly.
+            np.savez_compressed(
+                file,
+                key=key,
+                vocab=np.frombuffer("\n".join(corpus.vocab).encode("utf-8"), dtype=np.uint8),
+                token_ids=corpus.token_ids,
+                sentence_offsets=corpus.sentence_offsets,
+            )
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def tokenize_to_corpus(
+    file_path: str,
+    delim: list[str] | None = None,
+    workers: int | None = None,
+    ascii_only: bool = False,
+    cache: bool = False,
+) -> TokenizedCorpus:
+    """
+    Read a text file into a TokenizedCorpus. Tokenization is the same as `txt_to_string_list`.
+
+    Args:
+        file_path (str): Path to the input text file.
+        delim (list[str] | None): List of delimiters to split sentences.
+        workers (int | None): Number of processes to tokenize the file with.
+        ascii_only (bool): Treat only ASCII letters, digits and underscores as word characters.
+        cache (bool): Reuse or write a tokenized copy at `file_path + '.tok.npz'`. The copy is
+            used only if the file, the options and the tokenizer version are unchanged.
+            Default is False.
+
+    Returns:
+        TokenizedCorpus: The sentences of the file as token IDs.
+    """
+
+    _require_numpy()
+
+    if cache:
+        cache_path = file_path + ".tok.npz"
+        key = _corpus_cache_key(
+            file_path, _DEFAULT_DELIM if delim is None else frozenset(delim), ascii_only
+        )
+        corpus = _load_cached_corpus(cache_path, key)
+        if corpus is not None:
+            return corpus
+
+    corpus = TokenizedCorpus.from_sentences(
+        txt_to_string_list(file_path, delim, workers, ascii_only)
+    )
+
+    if cache:
+        _save_cached_corpus(cache_path, key, corpus)
+
+    return corpus
+
+
+def _rank_token_ids(token_ids: "np.ndarray", vocab: list[str]) -> list[tuple[str, int]]:
+    """
+    Count token IDs and return their words sorted by count, ties in first-occurrence order.
+
+    Args:
+        token_ids (np.ndarray): Token IDs to count.
+        vocab (list[str]): Token strings, indexed by token ID.
+
+    Returns:
+        list[tuple(str, int)]: A list of tuples, where each tuple contains a word and its frequency.
+    """
+
+    unique, first, counts = np.unique(token_ids, return_index=True, return_counts=True)
+    order = np.lexsort((first, -counts))
+    return [
+        (vocab[i], count)
+        for i, count in zip(unique[order].tolist(), counts[order].tolist())
+    ]
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _count_ngrams(ids, starts, ends, n, base):
+        """
+        Count n-grams of token IDs within each sentence's [start, end) slice.
+
+        Each window is packed into a single int64 as a base-`base` number, so keys
+        are exact (no hash collisions) and can be decoded back into token IDs.
+        Keys and counts are returned as arrays in order of first occurrence.
+        """
+        counts = Dict.empty(key_type=types.int64, value_type=types.int64)
+        for s in range(starts.shape[0]):
+            for i in range(starts[s], ends[s] - n + 1):
+                key = 0
+                for k in range(n):
+                    key = key * base + ids[i + k]
+                counts[key] = counts.get(key, 0) + 1
+
+        keys = np.empty(len(counts), dtype=np.int64)
+        values = np.empty(len(counts), dtype=np.int64)
+        j = 0
+        for key, count in counts.items():
+            keys[j] = key
+            values[j] = count
+            j += 1
+        return keys, values
+
+
+def _phrase_frequency_numba(
+    corpus: TokenizedCorpus, phrase_len: int, top_k: int | None = None
+) -> list[tuple[str, int]] | None:
+    """
+    Numba-backed implementation of `phrase_frequency` over a TokenizedCorpus.
+
+    Args:
+        corpus (TokenizedCorpus): The sentences to count phrases in.
+        phrase_len (int): The length of the phrases to count.
+        top_k (int | None): Only return the `top_k` most frequent phrases, or all if None.
+
+    Returns:
+        list[tuple(str, int)] | None: The phrase frequencies, or None if the vocabulary is
+            too large for a phrase to be packed into an int64 key.
+    """
+
+    base = max(len(corpus.vocab), 1)
+    if base**phrase_len >= 2**63:
+        return None
+
+    offsets = corpus.sentence_offsets
+    keys, counts = _count_ngrams(
+        corpus.token_ids, offsets[:-1], offsets[1:], phrase_len, base
+    )
+
+    # Decode only after sorting; a stable sort keeps ties in first-occurrence order.
+    order = np.argsort(-counts, kind="stable")[:top_k]
+    words = corpus.vocab
+    phrase_freq = []
+    for key, count in zip(keys[order].tolist(), counts[order].tolist()):
+        phrase = []
+        for _ in range(phrase_len):
+            key, token_id = divmod(key, base)
+            phrase.append(words[token_id])
+        phrase_freq.append((" ".join(reversed(phrase)), count))
+
+    return phrase_freq
+
+
+def _phrase_frequency_numpy(
+    corpus: TokenizedCorpus, phrase_len: int, top_k: int | None = None
+) -> list[tuple[str, int]]:
+    """
+    NumPy implementation of `phrase_frequency` over a TokenizedCorpus.
+
+    Args:
+        corpus (TokenizedCorpus): The sentences to count phrases in.
+        phrase_len (int): The length of the phrases to count.
+        top_k (int | None): Only return the `top_k` most frequent phrases, or all if None.
+
+    Returns:
+        list[tuple(str, int)]: A list of tuples, where each tuple contains a phrase and its frequency.
+    """
+
+    ids = corpus.token_ids
+    if len(ids) < phrase_len:
+        return []
+
+    # Keep only windows that end inside the sentence they start in.
+    offsets = corpus.sentence_offsets
+    sentence_end = np.repeat(offsets[1:], np.diff(offsets))
+    starts = np.arange(len(ids) - phrase_len + 1)
+    windows = sliding_window_view(ids, phrase_len)[
+        sentence_end[: len(starts)] >= starts + phrase_len
+    ]
+
+    # Pack each window into one int64 when it fits; np.unique over rows is far slower.
+    base = max(len(corpus.vocab), 1)
+    if base**phrase_len < 2**63:
+        keys = windows[:, 0].astype(np.int64)
+        for k in range(1, phrase_len):
+            keys = keys * base + windows[:, k]
+        _, first, counts = np.unique(keys, return_index=True, return_counts=True)
+    else:
+        _, first, counts = np.unique(
+            windows, axis=0, return_index=True, return_counts=True
+        )
+
+    order = np.lexsort((first, -counts))[:top_k]
+    words = corpus.vocab
+    return [
+        (" ".join([words[i] for i in phrase]), count)
+        for phrase, count in zip(windows[first[order]].tolist(), counts[order].tolist())
+    ]
 
 
 def phrase_frequency(
-    sentences: list[list[str]], phrase_len: int
+    sentences: Iterable[list[str]] | TokenizedCorpus,
+    phrase_len: int,
+    top_k: int | None = None,
 ) -> list[tuple[str, int]]:
     """
     Count the frequency of phrases of a given length in a list of sentences.
 
     Args:
-        sentences (list[list[str]]): A list of lists, where each inner list contains strings.
+        sentences (Iterable[list[str]] | TokenizedCorpus): A list of lists, where each inner
+            list contains strings, or the same sentences as a TokenizedCorpus. Any iterable of
+            sentences works, e.g. `iter_sentences(...)` to count without loading the whole file.
         phrase_len (int): The length of the phrases to count.
+        top_k (int | None): Only return the `top_k` most frequent phrases. Default is None,
+            which returns all of them.
 
     Returns:
         set[tuple(str, int)]: A set of tuples, where each tuple contains a phrase and its frequency.
+
+    Raises:
+        ValueError: If `phrase_len` is less than 1 or `top_k` is negative.
     """
 
-    phrase_freq = {}
+    if phrase_len < 1:
+        raise ValueError("phrase_len must be at least 1.")
+    if top_k is not None and top_k < 0:
+        raise ValueError("top_k must not be negative.")
+
+    if isinstance(sentences, TokenizedCorpus):
+        if njit is not None:
+            result = _phrase_frequency_numba(sentences, phrase_len, top_k)
+            if result is not None:
+                return result
+        return _phrase_frequency_numpy(sentences, phrase_len, top_k)
+
+    # Count tuple windows and only join the distinct phrases into strings at the end.
+    phrase_freq = Counter()
+    update = phrase_freq.update
+    join = " ".join
 
     for sentence in sentences:
         if len(sentence) < phrase_len:
             continue
-        for i in range(len(sentence) - phrase_len + 1):
-            phrase = " ".join(sentence[i : i + phrase_len])
-            if phrase in phrase_freq:
-                phrase_freq[phrase] += 1
-            else:
-                phrase_freq[phrase] = 1
+        update(zip(*[sentence[i:] for i in range(phrase_len)]))
 
-    return sorted(phrase_freq.items(), key=lambda x: x[1], reverse=True)
+    # most_common(k) selects with a heap instead of sorting every phrase.
+    return [(join(phrase), count) for phrase, count in phrase_freq.most_common(top_k)]
 
 
-def next_word_frequency(
-    sentences: list[list[str]], word: str
-) -> list[tuple[str, float]]:
+def build_bigram_index(sentences: list[list[str]]) -> dict[str, Counter]:
     """
-    Calculate the frequencies of words following a specific word in a list of sentences.
+    Build an index mapping each word to a count of the words that follow it.
 
     Args:
         sentences (list[list[str]]): A list of lists, where each inner list contains strings.
-        word (str): The word to calculate the next word probabilities for.
 
     Returns:
-        list[tuple(str, float)]: A list of tuples, where each tuple contains a word and its number of occurences.
+        dict[str, Counter]: A dictionary mapping each word to a Counter of its next words.
     """
 
-    next_word_freq = {}
-    total_count = 0
+    index = defaultdict(Counter)
 
     for sentence in sentences:
-        for i in range(len(sentence) - 1):
-            if sentence[i] == word:
-                next_word = sentence[i + 1]
-                if next_word in next_word_freq:
-                    next_word_freq[next_word] += 1
-                else:
-                    next_word_freq[next_word] = 1
-                total_count += 1
+        for a, b in zip(sentence, islice(sentence, 1, None)):
+            index[a][b] += 1
+
+    return dict(index)
+
+
+def next_word_frequency(
+    sentences: list[list[str]] | TokenizedCorpus,
+    word: str,
+    bigram_index: dict[str, Counter] | None = None,
+) -> list[tuple[str, int]]:
+    """
+    Calculate the frequencies of words following a specific word in a list of sentences.
+
+    Args:
+        sentences (list[list[str]] | TokenizedCorpus): A list of lists, where each inner list
+            contains strings, or the same sentences as a TokenizedCorpus.
+        word (str): The word to calculate the next word probabilities for.
+        bigram_index (dict[str, Counter] | None): Index from `build_bigram_index` for these
+            sentences. When given, the sentences are not scanned; build it once when querying
+            many words against the same corpus.
+
+    Returns:
+        list[tuple(str, int)]: A list of tuples, where each tuple contains a word and its number of occurences.
+    """
+
+    if bigram_index is not None:
+        next_word_freq = bigram_index.get(word, Counter())
+        return sorted(next_word_freq.items(), key=lambda x: x[1], reverse=True)
+
+    if isinstance(sentences, TokenizedCorpus):
+        word_id = sentences.token_index.get(word)
+        if word_id is None:
+            return []
+        ids = sentences.token_ids
+        # A match at the last token of a sentence has no next word in that sentence.
+        is_last = np.zeros(len(ids), dtype=bool)
+        is_last[sentences.sentence_offsets[1:] - 1] = True
+        positions = np.flatnonzero((ids == word_id) & ~is_last)
+        return _rank_token_ids(ids[positions + 1], sentences.vocab)
+
+    # One generator over all sentences; the C-level `in` check skips sentences without the word.
+    next_word_freq = Counter(
+        b
+        for sentence in sentences
+        if word in sentence
+        for a, b in zip(sentence, islice(sentence, 1, None))
+        if a == word
+    )
 
     return sorted(next_word_freq.items(), key=lambda x: x[1], reverse=True)
 
 
 def word_frequency_given_word(
-    sentences: list[list[str]], word: str
+    sentences: list[list[str]] | TokenizedCorpus, word: str | list[str]
 ) -> list[tuple[str, int]]:
     """
     Count the frequency of words only in sentences that contain a specific word.
 
     Args:
-        sentences (list[list[str]]): A list of lists, where each inner list contains strings.
-        word (str): The word to filter sentences by.
+        sentences (list[list[str]] | TokenizedCorpus): A list of lists, where each inner list
+            contains strings, or the same sentences as a TokenizedCorpus.
+        word (str | list[str]): The word to filter sentences by, or a list of words to keep
+            sentences containing any of them.
     Returns:
         list[tuple(str, int)]: A list of tuples, where each tuple contains a word and its frequency.
     """
 
-    word_freq = {}
+    words = frozenset([word] if isinstance(word, str) else word)
 
-    for sentence in sentences:
-        if word in sentence:
-            for w in sentence:
-                if w in word_freq:
-                    word_freq[w] += 1
-                else:
-                    word_freq[w] = 1
+    if isinstance(sentences, TokenizedCorpus):
+        index = sentences.token_index
+        query_ids = [index[w] for w in words if w in index]
+        if not query_ids:
+            return []
+        ids = sentences.token_ids
+        lengths = np.diff(sentences.sentence_offsets)
+        sentence_of_token = np.repeat(np.arange(len(lengths)), lengths)
+        matching = np.zeros(len(lengths), dtype=bool)
+        matching[sentence_of_token[np.isin(ids, query_ids)]] = True
+        return _rank_token_ids(ids[matching[sentence_of_token]], sentences.vocab)
 
-    return sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
+    # One hashed scan per sentence, however many query words there are.
+    matching = (sentence for sentence in sentences if not words.isdisjoint(sentence))
+    return Counter(chain.from_iterable(matching)).most_common()
+
+
+@lru_cache(maxsize=None)
+def _openai_client() -> openai.OpenAI:
+    """
+    Return the OpenAI client shared by all calls, so pooled connections are reused.
+
+    Returns:
+        openai.OpenAI: The client.
+    """
+
+    return openai.OpenAI(api_key=get_api_key())
+
+
+def _important_word(client: openai.OpenAI, line: str) -> str:
+    """
+    Ask the model for the most important word of a line.
+
+    Args:
+        client (openai.OpenAI): The client to send the request with.
+        line (str): A line of text.
+
+    Returns:
+        str: The model's answer, stripped of surrounding whitespace.
+    """
+
+    response = client.chat.completions.create(
+        model="gpt-4.1-turbo",
+        messages=[
+            {
+                "role": "user",
+                "content": f"Identify the most important word in the following sentence: {line}",
+            }
+        ],
+    )
+    return response.choices[0].message.content.strip()
 
 
 def most_important_words(
@@ -139,6 +801,7 @@ def most_important_words(
     ) -> list[tuple[str, int]]:
     """
     Uses OpenAI's GPT-4.1 nano to identify the most important word in each line of a text file.
+    Requests are sent concurrently, and identical lines are only sent once.
     Args:
         sentences (list[list[str]]): A list of lists, where each inner list contains strings.
         input_file (str): The path to the input text file.
@@ -146,28 +809,37 @@ def most_important_words(
         list[tuple(str, int)]: A list of tuples, where each tuple contains a word and its frequency.
     """
 
-    openai.api_key = get_api_key()
-
-    important_words = {}
+    # Create the shared client here, not in the workers, so concurrent first calls cannot
+    # each build their own, and a missing API key fails before any work is scheduled.
+    client = _openai_client()
 
     with open(input_file, "r", encoding="utf-8") as file:
-        text = file.readlines()
-        for line in text:
-            response = openai.ChatCompletion.create(
-                model="gpt-4.1-turbo",
-                messages=[
-                    {
-                        "role": "user",
-                        "content": f"Identify the most important word in the following sentence: {line}",
-                    }
-                ],
-            )
-            important_word = response["choices"][0]["message"]["content"].strip()
-            if important_word in important_words:
-                important_words[important_word] += 1
-            else:
-                important_words[important_word] = 1
-
-
-
-
+        lines = file.readlines()
+
+    unique_lines = list(dict.fromkeys(lines))
+    failed = threading.Event()
+
+    def ask(line: str) -> str | None:
+        # Requests queued behind a failure are skipped. Workers pick lines up in order, so
+        # the failing future always comes before any skipped one when results are read.
+        if failed.is_set():
+            return None
+        try:
+            return _important_word(client, line)
+        except BaseException:
+            failed.set()
+            raise
+
+    with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_REQUESTS) as executor:
+        futures = [executor.submit(ask, line) for line in unique_lines]
+        try:
+            important_word = {
+                line: future.result() for line, future in zip(unique_lines, futures)
+            }
+        except BaseException:
+            # Stop on the first failure instead of sending every queued request.
+            failed.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    return Counter(important_word[line] for line in lines).most_common()